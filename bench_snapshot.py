@@ -0,0 +1,159 @@
+"""Memory and latency of GET /tenders: old ORM path vs the columnar snapshot.
+
+Usage: python bench_snapshot.py [N]   (default N = 1,000,000 tenders)
+
+Both paths read the same N synthetic tenders from a temporary SQLite database.
+Summaries live in a Python dict instead of MongoDB, which flatters the ORM path:
+in production it also made one find_one() round-trip per tender.
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, insert, func
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from tender_snapshot import TenderSnapshot, NO_SUMMARY
+
+Base = declarative_base()
+
+# Mirrors main.Tender (main.py connects to Postgres/Mongo at import time)
+class Tender(Base):
+    __tablename__ = "tenders"
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String)
+    province = Column(String)
+    deadline = Column(DateTime)
+    buyer = Column(String)
+    budget = Column(Integer)
+    uploaded_at = Column(DateTime, default=datetime.utcnow)
+
+PROVINCES = ["Gauteng", "Western Cape", "KwaZulu-Natal", "Eastern Cape", "Limpopo",
+             "Mpumalanga", "North West", "Free State", "Northern Cape"]
+BUYERS = [f"Municipality {i}" for i in range(500)] + ["Government"]
+
+def populate(session_factory, engine, n):
+    rng = random.Random(42)
+    base = datetime(2025, 1, 1)
+    summaries = {}
+    with engine.begin() as conn:
+        batch = []
+        for i in range(1, n + 1):
+            batch.append({
+                "id": i,
+                "title": f"tender_{i:07d}.pdf",
+                "province": rng.choice(PROVINCES),
+                "deadline": base + timedelta(days=rng.randint(0, 900)),
+                "buyer": rng.choice(BUYERS),
+                "budget": rng.randint(10_000, 50_000_000),
+                "uploaded_at": base + timedelta(seconds=i),
+            })
+            summaries[i] = f"Supply and delivery of goods for tender {i}. Briefing session is compulsory."
+            if len(batch) == 50_000:
+                conn.execute(insert(Tender), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(Tender), batch)
+    return summaries
+
+def orm_request(session_factory, summaries):
+    # Baseline get_tenders(): ORM objects -> dicts -> jsonable_encoder -> json.dumps (JSONResponse)
+    db = session_factory()
+    try:
+        tender_data = []
+        for tender in db.query(Tender).all():
+            tender_data.append({
+                "id": tender.id,
+                "title": tender.title,
+                "province": tender.province,
+                "deadline": tender.deadline,
+                "buyer": tender.buyer,
+                "budget": tender.budget,
+                "uploaded_at": tender.uploaded_at,
+                "summary": summaries.get(tender.id, NO_SUMMARY),
+            })
+        return json.dumps(jsonable_encoder(tender_data), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    finally:
+        db.close()
+
+def snapshot_load(session_factory, summaries):
+    db = session_factory()
+    try:
+        rows = db.query(Tender.id, Tender.title, Tender.province, Tender.deadline,
+                        Tender.buyer, Tender.budget, Tender.uploaded_at).order_by(Tender.id).yield_per(10000)
+        summary_docs = ({"tender_id": k, "summary": v} for k, v in summaries.items())
+        snapshot = TenderSnapshot()
+        snapshot.load(rows, summary_docs, signature=(len(summaries), len(summaries)))
+        return snapshot
+    finally:
+        db.close()
+
+def signature_check(session_factory):
+    # Per-request staleness probe from main.refresh_tender_snapshot (Postgres half)
+    db = session_factory()
+    try:
+        return db.query(func.max(Tender.id)).scalar()
+    finally:
+        db.close()
+
+def timed(fn, repeat=1):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def traced(fn):
+    tracemalloc.start()
+    result = fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, peak, result
+
+def mb(n):
+    return f"{n / 2**20:8.1f} MB"
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        print(f"Populating {n:,} tenders ...")
+        summaries = populate(session_factory, engine, n)
+
+        print("\nORM path (baseline GET /tenders, full list)")
+        seconds, body = timed(lambda: orm_request(session_factory, summaries))
+        print(f"  latency            {seconds:8.2f} s   ({len(body):,} bytes)")
+        _, peak, _ = traced(lambda: orm_request(session_factory, summaries))
+        print(f"  peak memory        {mb(peak)}")
+
+        print("\nSnapshot path")
+        seconds, snapshot = timed(lambda: snapshot_load(session_factory, summaries))
+        print(f"  load (once)        {seconds:8.2f} s")
+        retained, peak, snapshot = traced(lambda: snapshot_load(session_factory, summaries))
+        print(f"  resident snapshot  {mb(retained)}   (peak during load {mb(peak).strip()})")
+
+        seconds, _ = timed(lambda: signature_check(session_factory), repeat=5)
+        print(f"  staleness check    {seconds * 1000:8.1f} ms per request (max id)")
+
+        queries = {
+            "full list (frontend default)": {},
+            "province filter, deadline sort, page of 50": dict(province="Gauteng", sort="deadline", limit=50),
+            "buyer filter, budget desc, page 10 of 50": dict(buyer="Government", sort="budget", order="desc", offset=450, limit=50),
+            "open only, province sort, page of 50": dict(open_only=True, sort="province", limit=50),
+        }
+        for label, params in queries.items():
+            seconds, body = timed(lambda: snapshot.query(**params), repeat=5)
+            _, peak, _ = traced(lambda: snapshot.query(**params))
+            print(f"  {label:44s} {seconds * 1000:9.1f} ms  peak {mb(peak).strip():>10s}  ({len(body):,} bytes)")
+
+if __name__ == "__main__":
+    main()
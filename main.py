@@ -1,6 +1,8 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine, Column, Integer, String, DateTime
+from fastapi.responses import Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import OperationalError
@@ -13,7 +15,9 @@ from datetime import datetime
 import logging
 import re
 import time
+from contextlib import contextmanager
 from typing import Optional
+from tender_snapshot import TenderSnapshot, SORTABLE_FIELDS
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -80,6 +84,33 @@ except Exception as e:
     logger.error(f"Failed to load DistilBART model: {str(e)}")
     logger.info("Using fallback summarization")
 
+# Columnar tender snapshot serving /tenders; see tender_snapshot.py. Set
+# TENDER_SNAPSHOT_TTL (seconds) to also reload periodically as a backstop for
+# deletes/edits made outside this app; by default only signature changes reload.
+snapshot_ttl = os.getenv("TENDER_SNAPSHOT_TTL")
+tender_snapshot = TenderSnapshot(ttl=float(snapshot_ttl) if snapshot_ttl else None)
+
+@contextmanager
+def fetch_tender_snapshot():
+    # Own session: a background reload outlives the request that triggered it
+    db = SessionLocal()
+    try:
+        # Plain column tuples (no ORM objects) and all summaries in one pass
+        rows = db.query(Tender.id, Tender.title, Tender.province, Tender.deadline,
+                        Tender.buyer, Tender.budget, Tender.uploaded_at).order_by(Tender.id).yield_per(10000)
+        summary_docs = summaries_collection.find({"tender_id": {"$type": "number"}}, {"_id": 0, "tender_id": 1, "summary": 1})
+        yield rows, summary_docs
+    finally:
+        db.close()
+
+def refresh_tender_snapshot(db):
+    # Cheap signature of both stores, so uploads from other workers/processes or
+    # POST /workspace trigger a reload on the next query. max(id) is an index
+    # lookup; count(*) would scan the table on every request.
+    max_id = db.query(func.max(Tender.id)).scalar()
+    signature = (max_id, summaries_collection.estimated_document_count())
+    tender_snapshot.refresh(signature, fetch_tender_snapshot)
+
 def clean_text(text: str) -> str:
     if not text:
         return ""
@@ -174,6 +205,8 @@ async def upload_tender(file: UploadFile = File(...), db: SessionLocal = Depends
         db.add(tender)
         db.commit()
         tender_id = tender.id
+        tender_row = (tender.id, tender.title, tender.province, tender.deadline,
+                      tender.buyer, tender.budget, tender.uploaded_at)
         db.close()
         
         summaries_collection.insert_one({
@@ -182,6 +215,7 @@ async def upload_tender(file: UploadFile = File(...), db: SessionLocal = Depends
             "text": text[:2000],
             "summary": summary
         })
+        await run_in_threadpool(tender_snapshot.append, *tender_row, summary)
         
         logger.info(f"Upload successful for tender_id: {tender_id}")
         return {"tender_id": tender_id, "summary": summary}
@@ -191,26 +225,22 @@ async def upload_tender(file: UploadFile = File(...), db: SessionLocal = Depends
         logger.error(f"Upload failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
+# Plain def: runs in the threadpool, so a snapshot reload never blocks the event loop
 @app.get("/tenders")
-async def get_tenders(db: SessionLocal = Depends(get_db)):
+def get_tenders(province: Optional[str] = None, buyer: Optional[str] = None, open_only: bool = False,
+                sort: str = "id", order: str = "asc", offset: int = 0, limit: Optional[int] = None,
+                db: SessionLocal = Depends(get_db)):
+    if sort not in SORTABLE_FIELDS:
+        raise HTTPException(status_code=400, detail=f"Invalid sort field: {sort}")
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="Order must be 'asc' or 'desc'")
+    if offset < 0 or (limit is not None and limit < 0):
+        raise HTTPException(status_code=400, detail="Offset and limit must be non-negative")
     try:
-        tenders = db.query(Tender).all()
-        tender_data = []
-        for tender in tenders:
-            summary_doc = summaries_collection.find_one({"tender_id": tender.id})
-            summary = summary_doc["summary"] if summary_doc and "summary" in summary_doc else "No summary available"
-            logger.info(f"Tender {tender.id} summary: {summary}")  # Debug log
-            tender_data.append({
-                "id": tender.id,
-                "title": tender.title,
-                "province": tender.province,
-                "deadline": tender.deadline,
-                "buyer": tender.buyer,
-                "budget": tender.budget,
-                "uploaded_at": tender.uploaded_at,
-                "summary": summary
-            })
-        return tender_data
+        refresh_tender_snapshot(db)
+        body = tender_snapshot.query(province=province, buyer=buyer, open_only=open_only,
+                                     sort=sort, order=order, offset=offset, limit=limit)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"Failed to fetch tenders: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch tenders: {str(e)}")
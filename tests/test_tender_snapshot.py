@@ -0,0 +1,194 @@
+import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import orjson
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from tender_snapshot import TenderSnapshot, SORTABLE_FIELDS, NO_SUMMARY
+
+# (id, title, province, deadline, buyer, budget, uploaded_at)
+ROWS = [
+    (1, "road.pdf", "Gauteng", datetime(2026, 3, 1), "City", 500, datetime(2025, 1, 1, 8, 0, 0, 123456)),
+    (2, "school.pdf", None, None, None, None, None),
+    (3, "clinic.pdf", "Limpopo", datetime(2026, 1, 1), "Government", 500, datetime(2025, 1, 3)),
+    (4, "bridge.pdf", "Gauteng", datetime(2026, 3, 1), "Government", 900, datetime(2025, 1, 1, 8, 0, 0, 123456)),
+    (5, "Düsseldorf pipes.pdf", "Eastern Cape", datetime(2020, 1, 1), "City", 100, datetime(2025, 1, 5)),
+]
+SUMMARIES = [
+    {"tender_id": 1, "summary": "Road works."},
+    {"tender_id": 1, "summary": "Duplicate, ignored."},
+    {"tender_id": 3},
+    {"tender_id": 4, "summary": "Bridge repairs — phase 2."},
+]
+
+
+def make_snapshot(rows=ROWS, summaries=SUMMARIES):
+    snapshot = TenderSnapshot()
+    snapshot.load(rows, summaries, signature=(max(r[0] for r in rows), len(summaries)))
+    return snapshot
+
+
+def ids(body):
+    return [row["id"] for row in orjson.loads(body)]
+
+
+def test_default_query_returns_all_tenders_by_id():
+    assert ids(make_snapshot().query()) == [1, 2, 3, 4, 5]
+
+
+def test_output_is_byte_identical_to_orm_path():
+    # What the old get_tenders() returned through FastAPI's JSONResponse
+    summaries = {1: "Road works.", 3: NO_SUMMARY, 4: "Bridge repairs — phase 2."}
+    tender_data = [
+        {"id": r[0], "title": r[1], "province": r[2], "deadline": r[3], "buyer": r[4],
+         "budget": r[5], "uploaded_at": r[6], "summary": summaries.get(r[0], NO_SUMMARY)}
+        for r in ROWS
+    ]
+    expected = json.dumps(jsonable_encoder(tender_data), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    assert make_snapshot().query() == expected
+
+
+@pytest.mark.parametrize("sort,asc", [
+    ("id", [1, 2, 3, 4, 5]),
+    ("deadline", [5, 3, 1, 4, 2]),
+    ("budget", [5, 1, 3, 4, 2]),
+    ("uploaded_at", [1, 4, 3, 5, 2]),
+    ("province", [5, 1, 4, 3, 2]),
+    ("buyer", [1, 5, 3, 4, 2]),
+])
+def test_sort_keeps_nulls_last_and_breaks_ties_by_id(sort, asc):
+    snapshot = make_snapshot()
+    assert ids(snapshot.query(sort=sort)) == asc
+
+
+@pytest.mark.parametrize("sort,desc", [
+    ("id", [5, 4, 3, 2, 1]),
+    ("deadline", [1, 4, 3, 5, 2]),
+    ("budget", [4, 1, 3, 5, 2]),
+    ("uploaded_at", [5, 3, 1, 4, 2]),
+    ("province", [3, 1, 4, 5, 2]),
+    ("buyer", [3, 4, 1, 5, 2]),
+])
+def test_desc_sort_keeps_nulls_last_and_ties_ascending(sort, desc):
+    snapshot = make_snapshot()
+    assert ids(snapshot.query(sort=sort, order="desc")) == desc
+
+
+def test_sortable_fields_are_all_covered():
+    snapshot = make_snapshot()
+    for sort in SORTABLE_FIELDS:
+        assert sorted(ids(snapshot.query(sort=sort))) == [1, 2, 3, 4, 5]
+
+
+def test_filters():
+    snapshot = make_snapshot()
+    assert ids(snapshot.query(province="Gauteng")) == [1, 4]
+    assert ids(snapshot.query(buyer="Government")) == [3, 4]
+    assert ids(snapshot.query(province="Gauteng", buyer="City")) == [1]
+    assert snapshot.query(province="Atlantis") == b"[]"
+
+
+def test_open_only_excludes_past_and_missing_deadlines():
+    future = datetime.utcnow() + timedelta(days=30)
+    rows = [
+        (1, "a", "Gauteng", future, "City", 1, None),
+        (2, "b", "Gauteng", None, "City", 1, None),
+        (3, "c", "Gauteng", datetime(2020, 1, 1), "City", 1, None),
+    ]
+    assert ids(make_snapshot(rows, []).query(open_only=True)) == [1]
+
+
+def test_offset_and_limit_page_the_sorted_rows():
+    snapshot = make_snapshot()
+    assert ids(snapshot.query(sort="budget", order="desc", offset=1, limit=2)) == [1, 3]
+    assert ids(snapshot.query(offset=3)) == [4, 5]
+    assert ids(snapshot.query(limit=1)) == [1]
+    assert snapshot.query(offset=10) == b"[]"
+    assert snapshot.query(limit=0) == b"[]"
+
+
+def test_summaries_first_document_wins_and_bad_ids_are_skipped():
+    docs = [{"tender_id": [1]}, {"tender_id": {}}, {"summary": "no id"},
+            {"tender_id": True, "summary": "bool"}, {"tender_id": 2.0, "summary": "float id"}] + SUMMARIES
+    rows = {row["id"]: row["summary"] for row in orjson.loads(make_snapshot(summaries=docs).query())}
+    assert rows == {1: "Road works.", 2: "float id", 3: NO_SUMMARY,
+                    4: "Bridge repairs — phase 2.", 5: NO_SUMMARY}
+
+
+def test_append_before_first_load_is_ignored():
+    snapshot = TenderSnapshot()
+    snapshot.append(*ROWS[0], "Road works.")
+    assert snapshot.size == 0
+    assert not snapshot.loaded
+
+
+def test_append_updates_rows_dictionaries_and_signature():
+    snapshot = make_snapshot()
+    assert snapshot.signature == (5, 4)
+    snapshot.append(6, "dam.pdf", "Free State", datetime(2026, 6, 1), "Water Board", 50, None, "Dam.")
+    assert snapshot.signature == (6, 5)
+    assert not snapshot.is_stale((6, 5))
+    assert ids(snapshot.query(province="Free State")) == [6]
+    assert ids(snapshot.query(sort="province")) == [5, 6, 1, 4, 3, 2]
+    # An id lower than the current max (another worker raced ahead) keeps the max
+    snapshot.append(0, "x.pdf", None, None, None, None, None, NO_SUMMARY)
+    assert snapshot.signature == (6, 6)
+
+
+def test_append_grows_past_initial_capacity():
+    snapshot = make_snapshot()
+    for tender_id in range(6, 3000):
+        snapshot.append(tender_id, "t.pdf", "Gauteng", None, "City", tender_id, None, NO_SUMMARY)
+    assert snapshot.size == 2999
+    assert ids(snapshot.query(sort="budget", order="desc", limit=2)) == [2999, 2998]
+
+
+def fetcher(rows, calls, started=None, release=None):
+    @contextmanager
+    def fetch():
+        calls.append(len(rows))
+        if started:
+            started.set()
+            release.wait(5)
+        yield rows, []
+    return fetch
+
+
+def test_refresh_loads_once_per_signature():
+    snapshot, calls = TenderSnapshot(), []
+    snapshot.refresh((5, 0), fetcher(ROWS, calls))
+    snapshot.refresh((5, 0), fetcher(ROWS, calls))
+    assert calls == [5]
+    snapshot.refresh((6, 0), fetcher(ROWS[:2], calls), background=False)
+    assert calls == [5, 2]
+    assert snapshot.size == 2
+
+
+def test_refresh_serves_old_columns_while_one_thread_reloads():
+    snapshot, calls = TenderSnapshot(), []
+    snapshot.refresh((5, 0), fetcher(ROWS, calls))
+    started, release = threading.Event(), threading.Event()
+    snapshot.refresh((6, 0), fetcher(ROWS[:2], calls, started, release))
+    assert started.wait(5)
+    # Reload in flight: other callers neither block nor start a second reload
+    snapshot.refresh((6, 0), fetcher(ROWS[:1], calls))
+    assert ids(snapshot.query()) == [1, 2, 3, 4, 5]
+    release.set()
+    with snapshot._load_lock:
+        pass
+    assert calls == [5, 2]
+    assert ids(snapshot.query()) == [1, 2]
+
+
+def test_invalidate_and_ttl_force_a_reload():
+    snapshot, calls = TenderSnapshot(), []
+    snapshot.refresh((5, 0), fetcher(ROWS, calls))
+    snapshot.invalidate()
+    snapshot.refresh((5, 0), fetcher(ROWS, calls), background=False)
+    assert calls == [5, 5]
+    assert not snapshot.is_stale((5, 0))
+    snapshot.ttl = 0
+    assert snapshot.is_stale((5, 0))